@@ -20,6 +20,8 @@ class EmailBackend(AnymailRequestsBackend):
         self.secret_key = get_anymail_setting(
             "secret_key", esp_name=esp_name, kwargs=kwargs, allow_bare=True
         )
+        # (basic auth is the same for every message sent by this backend)
+        self.auth = (self.api_key, self.secret_key)
         api_url = get_anymail_setting(
             "api_url",
             esp_name=esp_name,
@@ -87,7 +89,7 @@ class EmailBackend(AnymailRequestsBackend):
 
 class MailjetPayload(RequestsPayload):
     def __init__(self, message, defaults, backend, *args, **kwargs):
-        auth = (backend.api_key, backend.secret_key)
+        auth = backend.auth
         http_headers = {
             "Content-Type": "application/json",
         }
@@ -56,6 +56,7 @@ def setup_and_run_tests(test_labels=None):
 
     tags = envlist("ANYMAIL_ONLY_TEST")
     exclude_tags = envlist("ANYMAIL_SKIP_TESTS")
+    parallel = envparallel("ANYMAIL_TEST_PARALLEL")
 
     # In automated testing, don't run live tests unless specifically requested
     if envbool("CONTINUOUS_INTEGRATION") and not envbool("ANYMAIL_RUN_LIVE_TESTS"):
@@ -75,7 +76,9 @@ def setup_and_run_tests(test_labels=None):
     django.setup()
 
     TestRunner = get_runner(settings)
-    test_runner = TestRunner(verbosity=1, tags=tags, exclude_tags=exclude_tags)
+    test_runner = TestRunner(
+        verbosity=1, tags=tags, exclude_tags=exclude_tags, parallel=parallel
+    )
     return test_runner.run_tests(test_labels)
 
 
@@ -116,5 +119,23 @@ def envlist(var):
     return val
 
 
+def envparallel(var):
+    """Returns value of environment variable var as a test process count.
+
+    Returns 0 (no parallel processes) if variable is empty or not set,
+    or the number of available CPUs if it is `'auto'`.
+    """
+    val = os.getenv(var, "").strip().lower()
+    if val == "":
+        return 0
+    elif val == "auto":
+        return os.cpu_count() or 1
+    else:
+        try:
+            return int(val)
+        except ValueError:
+            raise ValueError("invalid parallel value env[%r]=%r" % (var, val)) from None
+
+
 if __name__ == "__main__":
     runtests(test_labels=sys.argv[1:])
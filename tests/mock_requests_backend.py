@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import requests
 from django.core import mail
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, tag
 
 from anymail.exceptions import AnymailAPIError
 
@@ -56,6 +56,7 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
         self.mock_request = self.patch_request.start()
         self.addCleanup(self.patch_request.stop)
         self.set_mock_response()
+        self._api_call_json_cache = None  # (call_args, parsed json)
 
     def set_mock_response(
         self,
@@ -119,7 +120,7 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
         """
         if self.mock_request.call_args is None:
             raise AssertionError("API was not called")
-        (args, kwargs) = self.mock_request.call_args
+        args, kwargs = self.mock_request.call_args
         try:
             return kwargs[kwarg]
         except KeyError:
@@ -162,14 +163,34 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
         return self.get_api_call_arg("data", required)
 
     def get_api_call_json(self, required=True):
-        """Returns the data sent to the mock ESP API, json-parsed"""
+        """Returns the data sent to the mock ESP API, json-parsed
+
+        (Parses each API call's payload only once, no matter how many times
+        it is requested.)
+        """
+        call_args = self.mock_request.call_args
+        cache = self._api_call_json_cache
+        if call_args is not None and cache is not None and cache[0] is call_args:
+            return cache[1]
         # could be either the data param (as json str)
         # or the json param (needing formatting)
         value = self.get_api_call_arg("data", required=False)
         if value is not None:
-            return json.loads(value)
+            data = json.loads(value)
         else:
-            return self.get_api_call_arg("json", required)
+            data = self.get_api_call_arg("json", required)
+        self._api_call_json_cache = (call_args, data)
+        return data
+
+    def reset_and_get_api_call_json(self, required=True):
+        """Returns get_api_call_json(), then resets the mock ESP API.
+
+        Useful for tests that send more than once: afterward,
+        assertions can only see calls made by the next send.
+        """
+        data = self.get_api_call_json(required)
+        self.mock_request.reset_mock()
+        return data
 
     def get_api_call_headers(self, required=True):
         """Returns the headers sent to the mock ESP API"""
@@ -185,7 +206,7 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
 
     def get_api_prepared_request(self):
         """Returns the PreparedRequest that would have been sent"""
-        (args, kwargs) = self.mock_request.call_args
+        args, kwargs = self.mock_request.call_args
         kwargs.pop("timeout", None)  # Session-only param
         request = requests.Request(**kwargs)
         return request.prepare()
@@ -195,12 +216,16 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
             raise AssertionError(msg or "ESP API was called and shouldn't have been")
 
 
+@tag("session_sharing")
 class SessionSharingTestCases(RequestsBackendMockAPITestCase):
     """Common test cases for requests backend connection sharing.
 
     Instantiate for each ESP by:
     - subclassing
     - adding or overriding any tests as appropriate
+
+    These are tagged "session_sharing", so they can be skipped when iterating
+    on a single ESP (e.g., ANYMAIL_SKIP_TESTS=session_sharing).
     """
 
     def __init__(self, methodName="runTest"):
@@ -170,15 +170,18 @@ class SendDefaultsTests(TestBackendTestCase):
         self.message.send()
         params = self.get_send_params()
         # All these values came from ANYMAIL_SEND_DEFAULTS:
-        self.assertEqual(params["metadata"], {"global": "globalvalue"})
-        self.assertEqual(
-            params["send_at"], datetime(2016, 5, 12, 4, 17, 0, tzinfo=timezone.utc)
+        self.assertDictMatches(
+            {
+                "metadata": {"global": "globalvalue"},
+                "send_at": datetime(2016, 5, 12, 4, 17, 0, tzinfo=timezone.utc),
+                "tags": ["globaltag"],
+                "template_id": "my-template",
+                "track_clicks": True,
+                # Test EmailBackend merges esp_extra into params:
+                "globalextra": "globalsetting",
+            },
+            params,
         )
-        self.assertEqual(params["tags"], ["globaltag"])
-        self.assertEqual(params["template_id"], "my-template")
-        self.assertEqual(params["track_clicks"], True)
-        # Test EmailBackend merges esp_extra into params:
-        self.assertEqual(params["globalextra"], "globalsetting")
 
     @override_settings(
         ANYMAIL={
@@ -251,15 +254,16 @@ class SendDefaultsTests(TestBackendTestCase):
         # Send another message to make sure original SEND_DEFAULTS unchanged
         send_mail("subject", "body", "from@example.com", ["to@example.com"])
         params = self.get_send_params()
-        self.assertEqual(
-            params["metadata"], {"global": "globalvalue", "other": "othervalue"}
-        )
-        self.assertEqual(params["tags"], ["globaltag"])
-        self.assertEqual(params["track_clicks"], True)
-        self.assertEqual(params["track_opens"], False)
-        self.assertEqual(params["globalextra"], "globalsetting")
-        self.assertEqual(
-            params["deepextra"], {"deep1": "globaldeep1", "deep2": "globaldeep2"}
+        self.assertDictMatches(
+            {
+                "metadata": {"global": "globalvalue", "other": "othervalue"},
+                "tags": ["globaltag"],
+                "track_clicks": True,
+                "track_opens": False,
+                "globalextra": "globalsetting",
+                "deepextra": {"deep1": "globaldeep1", "deep2": "globaldeep2"},
+            },
+            params,
         )
 
     @override_settings(
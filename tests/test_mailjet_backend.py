@@ -1,4 +1,3 @@
-import json
 from base64 import b64encode
 from decimal import Decimal
 from email.mime.base import MIMEBase
@@ -25,8 +24,18 @@ from .utils import (
     decode_att,
     sample_image_content,
     sample_image_path,
+    test_file_content,
 )
 
+# Canned Mailjet API responses (read once, at import):
+SEND_RESPONSE_SUCCESS = test_file_content("mailjet-send-response-success.json")
+SEND_RESPONSE_MIXED_STATUS = test_file_content(
+    "mailjet-send-response-mixed-status.json"
+)
+ERROR_RESPONSE_GLOBAL = test_file_content("mailjet-error-response-global.json")
+ERROR_RESPONSE_NON_JSON = b"Ack! Bad proxy!"
+UNPARSABLE_RESPONSE = b"yikes, this isn't a real response"
+
 
 @tag("mailjet")
 @override_settings(
@@ -37,6 +46,8 @@ from .utils import (
     },
 )
 class MailjetBackendMockAPITestCase(RequestsBackendMockAPITestCase):
+    EXPECTED_AUTH = ("API KEY HERE", "SECRET KEY HERE")
+
     DEFAULT_RAW_RESPONSE = b"""{
         "Messages": [{
             "Status": "success",
@@ -72,8 +83,7 @@ class MailjetBackendStandardEmailTests(MailjetBackendMockAPITestCase):
         )
         self.assert_esp_called("/v3.1/send")
 
-        auth = self.get_api_call_auth()
-        self.assertEqual(auth, ("API KEY HERE", "SECRET KEY HERE"))
+        self.assertEqual(self.get_api_call_auth(), self.EXPECTED_AUTH)
 
         data = self.get_api_call_json()
         self.assertEqual(len(data["Messages"]), 1)
@@ -403,22 +413,14 @@ class MailjetBackendStandardEmailTests(MailjetBackendMockAPITestCase):
     def test_api_error_includes_details(self):
         """AnymailAPIError should include ESP's error message"""
         # JSON error response - global error:
-        error_response = json.dumps(
-            {
-                "ErrorIdentifier": "06df1144-c6f3-4ca7-8885-7ec5d4344113",
-                "ErrorCode": "mj-0002",
-                "ErrorMessage": "Helpful explanation from Mailjet.",
-                "StatusCode": 400,
-            }
-        ).encode("utf-8")
-        self.set_mock_response(status_code=400, raw=error_response)
+        self.set_mock_response(status_code=400, raw=ERROR_RESPONSE_GLOBAL)
         with self.assertRaisesMessage(
             AnymailAPIError, "Helpful explanation from Mailjet"
         ):
             self.message.send()
 
         # Non-JSON error response:
-        self.set_mock_response(status_code=500, raw=b"Ack! Bad proxy!")
+        self.set_mock_response(status_code=500, raw=ERROR_RESPONSE_NON_JSON)
         with self.assertRaisesMessage(AnymailAPIError, "Ack! Bad proxy!"):
             self.message.send()
 
@@ -432,14 +434,6 @@ class MailjetBackendStandardEmailTests(MailjetBackendMockAPITestCase):
 class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
     """Test backend support for Anymail added features"""
 
-    def test_envelope_sender(self):
-        self.message.envelope_sender = "bounce-handler@bounces.example.com"
-        self.message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(
-            data["Globals"]["Sender"], {"Email": "bounce-handler@bounces.example.com"}
-        )
-
     def test_metadata(self):
         # Mailjet expects the payload to be a single string
         # https://dev.mailjet.com/guides/#tagging-email-messages
@@ -455,32 +449,36 @@ class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
         with self.assertRaisesMessage(AnymailUnsupportedFeature, "send_at"):
             self.message.send()
 
-    def test_tags(self):
-        self.message.tags = ["receipt"]
-        self.message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["Globals"]["CustomCampaign"], "receipt")
-
+    # (attr, value, Globals key, expected Globals value)
+    SIMPLE_OPTION_CASES = [
+        (
+            "envelope_sender",
+            "bounce-handler@bounces.example.com",
+            "Sender",
+            {"Email": "bounce-handler@bounces.example.com"},
+        ),
+        ("tags", ["receipt"], "CustomCampaign", "receipt"),
+        ("track_opens", True, "TrackOpens", "enabled"),
+        ("track_clicks", True, "TrackClicks", "enabled"),
+        ("track_clicks", False, "TrackClicks", "disabled"),
+    ]
+
+    def test_simple_option_mapping(self):
+        for attr, value, key, expected in self.SIMPLE_OPTION_CASES:
+            with self.subTest(option=attr, value=value):
+                message = mail.EmailMultiAlternatives(
+                    "Subject", "Text Body", "from@example.com", ["to@example.com"]
+                )
+                setattr(message, attr, value)
+                message.send()
+                data = self.reset_and_get_api_call_json()
+                self.assertEqual(data["Globals"][key], expected)
+
+    def test_multiple_tags(self):
         self.message.tags = ["receipt", "repeat-user"]
         with self.assertRaisesMessage(AnymailUnsupportedFeature, "multiple tags"):
             self.message.send()
-
-    def test_track_opens(self):
-        self.message.track_opens = True
-        self.message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["Globals"]["TrackOpens"], "enabled")
-
-    def test_track_clicks(self):
-        self.message.track_clicks = True
-        self.message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["Globals"]["TrackClicks"], "enabled")
-
-        self.message.track_clicks = False
-        self.message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["Globals"]["TrackClicks"], "disabled")
+        self.assert_esp_not_called()
 
     def test_template(self):
         # template_id can be str or int (but must be numeric ID-not the template's name)
@@ -603,24 +601,7 @@ class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
     # noinspection PyUnresolvedReferences
     def test_send_attaches_anymail_status(self):
         """The anymail_status should be attached to the message when it is sent"""
-        response_content = json.dumps(
-            {
-                "Messages": [
-                    {
-                        "Status": "success",
-                        "To": [
-                            {
-                                "Email": "to1@example.com",
-                                "MessageUUID": "cb927469-36fd-4c02-bce4-0d199929a207",
-                                "MessageID": 12345678901234500,
-                                "MessageHref": "https://api.mailjet.com/v3/message"
-                                "/12345678901234500",
-                            }
-                        ],
-                    }
-                ]
-            }
-        ).encode("utf-8")
+        response_content = SEND_RESPONSE_SUCCESS
         self.set_mock_response(raw=response_content)
         msg = mail.EmailMessage(
             "Subject", "Message", "from@example.com", ["to1@example.com"]
@@ -645,41 +626,7 @@ class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
         # Mailjet's v3.1 API will partially fail a batch send, allowing valid emails
         # to go out. The API response doesn't identify the failed email addresses;
         # make sure we represent them correctly in the anymail_status.
-        response_content = json.dumps(
-            {
-                "Messages": [
-                    {
-                        "Status": "success",
-                        "CustomID": "",
-                        "To": [
-                            {
-                                "Email": "to-good@example.com",
-                                "MessageUUID": "556e896a-e041-4836-bb35-8bb75ee308c5",
-                                "MessageID": 12345678901234500,
-                                "MessageHref": "https://api.mailjet.com/v3/REST"
-                                "/message/12345678901234500",
-                            }
-                        ],
-                        "Cc": [],
-                        "Bcc": [],
-                    },
-                    {
-                        "Errors": [
-                            {
-                                "ErrorIdentifier": "f480a5a2-0334-4e08"
-                                "-b2b7-f372ce5669e0",
-                                "ErrorCode": "mj-0013",
-                                "StatusCode": 400,
-                                "ErrorMessage": '"invalid@123.4" is an invalid'
-                                " email address.",
-                                "ErrorRelatedTo": ["To[0].Email"],
-                            }
-                        ],
-                        "Status": "error",
-                    },
-                ]
-            }
-        ).encode("utf-8")
+        response_content = SEND_RESPONSE_MIXED_STATUS
         # Mailjet uses 400 for partial success:
         self.set_mock_response(raw=response_content, status_code=400)
         msg = mail.EmailMessage(
@@ -724,9 +671,7 @@ class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
         """
         If the send succeeds, but a non-JSON API response, should raise an API exception
         """
-        mock_response = self.set_mock_response(
-            status_code=200, raw=b"yikes, this isn't a real response"
-        )
+        mock_response = self.set_mock_response(status_code=200, raw=UNPARSABLE_RESPONSE)
         with self.assertRaises(AnymailAPIError):
             self.message.send()
         self.assertIsNone(self.message.anymail_status.status)
@@ -759,6 +704,23 @@ class MailjetBackendAnymailFeatureTests(MailjetBackendMockAPITestCase):
         ):
             self.message.send()
 
+    def test_no_extraneous_fields(self):
+        """Don't send empty fields that have no effect on sending"""
+        mail.send_mail("Subject", "Body", "from@example.com", ["to@example.com"])
+        data = self.get_api_call_json()
+        # Simple send should contain exactly this, nothing more:
+        self.assertEqual(
+            data,
+            {
+                "Globals": {
+                    "From": {"Email": "from@example.com"},
+                    "Subject": "Subject",
+                    "TextPart": "Body",
+                },
+                "Messages": [{"To": [{"Email": "to@example.com"}]}],
+            },
+        )
+
 
 @tag("mailjet")
 class MailjetBackendSessionSharingTestCase(
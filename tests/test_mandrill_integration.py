@@ -8,7 +8,7 @@ from django.test import SimpleTestCase, override_settings, tag
 from anymail.exceptions import AnymailAPIError, AnymailRecipientsRefused
 from anymail.message import AnymailMessage
 
-from .utils import AnymailTestMixin, sample_image_path
+from .utils import SAMPLE_IMAGE_FILENAME, AnymailTestMixin, sample_image_content
 
 ANYMAIL_TEST_MANDRILL_API_KEY = os.getenv("ANYMAIL_TEST_MANDRILL_API_KEY")
 ANYMAIL_TEST_MANDRILL_DOMAIN = os.getenv("ANYMAIL_TEST_MANDRILL_DOMAIN")
@@ -35,6 +35,18 @@ class MandrillBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
     for info on Mandrill test keys.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Share one open connection across all the tests:
+        cls.connection = mail.get_connection()
+        cls.connection.open()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
         self.from_email = self.addr("from")
@@ -43,6 +55,7 @@ class MandrillBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
             "Text content",
             self.from_email,
             [self.addr("test+to1")],
+            connection=self.connection,
         )
         self.message.attach_alternative("<p>HTML content</p>", "text/html")
 
@@ -93,10 +106,11 @@ class MandrillBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
             # no metadata, send_at, track_clicks support
             tags=["tag 1"],  # max one tag
             track_opens=True,
+            connection=self.connection,
         )
         message.attach("attachment1.txt", "Here is some\ntext for you", "text/plain")
         message.attach("attachment2.csv", "ID,Name\n1,Amy Lina", "text/csv")
-        cid = message.attach_inline_image_file(sample_image_path())
+        cid = message.attach_inline_image(sample_image_content(), SAMPLE_IMAGE_FILENAME)
         message.attach_alternative(
             "<p><b>HTML:</b> with <a href='http://example.com'>link</a>"
             "and image: <img src='cid:%s'></div>" % cid,
@@ -171,5 +185,7 @@ class MandrillBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         # Mandrill responds either 401 or 500 status for this case (it varies),
         # but always seems to include the message "Invalid API key".
         # Either response should result in an AnymailAPIError.
+        # use a new connection, with the overridden (invalid) API key:
+        self.message.connection = None
         with self.assertRaisesMessage(AnymailAPIError, "Invalid API key"):
             self.message.send()
@@ -19,6 +19,11 @@ from .webhook_cases import WebhookBasicAuthTestCase, WebhookTestCase
 
 TEST_WEBHOOK_KEY = "TEST_WEBHOOK_KEY"
 
+# HMAC already keyed with TEST_WEBHOOK_KEY, to .copy() for each signature
+TEST_WEBHOOK_KEY_HMAC = hmac.new(
+    key=TEST_WEBHOOK_KEY.encode("ascii"), digestmod=hashlib.sha1
+)
+
 
 def mandrill_args(
     events=None,
@@ -41,14 +46,7 @@ def mandrill_args(
     else:
         full_url = test_client_path
     mandrill_events = json.dumps(events)
-    signed_data = full_url + "mandrill_events" + mandrill_events
-    signature = b64encode(
-        hmac.new(
-            key=key.encode("ascii"),
-            msg=signed_data.encode("utf-8"),
-            digestmod=hashlib.sha1,
-        ).digest()
-    )
+    signature = mandrill_signature(full_url, mandrill_events, key)
     return {
         "path": test_client_path,
         "data": {"mandrill_events": mandrill_events},
@@ -56,6 +54,17 @@ def mandrill_args(
     }
 
 
+def mandrill_signature(full_url, mandrill_events, key=TEST_WEBHOOK_KEY):
+    """Returns Mandrill's webhook signature for (json str) mandrill_events"""
+    signed_data = full_url + "mandrill_events" + mandrill_events
+    if key == TEST_WEBHOOK_KEY:
+        signer = TEST_WEBHOOK_KEY_HMAC.copy()
+    else:
+        signer = hmac.new(key=key.encode("ascii"), digestmod=hashlib.sha1)
+    signer.update(signed_data.encode("utf-8"))
+    return b64encode(signer.digest())
+
+
 @tag("mandrill")
 class MandrillWebhookSettingsTestCase(WebhookTestCase):
     def test_requires_webhook_key(self):
@@ -75,15 +84,16 @@ class MandrillWebhookSettingsTestCase(WebhookTestCase):
 class MandrillWebhookSecurityTestCase(WebhookBasicAuthTestCase):
     should_warn_if_no_auth = False  # because we check webhook signature
 
+    # signed once for the class (auth, host, and key are the defaults)
+    send_event_kwargs = mandrill_args([{"event": "send"}])
+
     def call_webhook(self):
-        kwargs = mandrill_args([{"event": "send"}])
-        return self.client.post(**kwargs)
+        return self.client.post(**self.send_event_kwargs)
 
     # Additional tests are in WebhookBasicAuthTestCase
 
     def test_verifies_correct_signature(self):
-        kwargs = mandrill_args([{"event": "send"}])
-        response = self.client.post(**kwargs)
+        response = self.client.post(**self.send_event_kwargs)
         self.assertEqual(response.status_code, 200)
 
     def test_verifies_missing_signature(self):
@@ -292,6 +302,44 @@ class MandrillTrackingTestCase(WebhookTestCase):
         self.assertEqual(event.recipient, "recipient@example.com")
         self.assertEqual(event.description, "manual edit")
 
+    def test_multiple_events(self):
+        # Mandrill batches events, so a single webhook call can carry several
+        raw_events = [
+            {
+                "event": "send",
+                "msg": {"email": "recipient@example.com", "_id": "id1"},
+                "_id": "id1",
+                "ts": 1461095246,
+            },
+            {
+                "event": "hard_bounce",
+                "msg": {"email": "bounce@example.com", "_id": "id2"},
+                "_id": "id2",
+                "ts": 1461095247,
+            },
+            {
+                "event": "click",
+                "msg": {"email": "recipient@example.com", "_id": "id1"},
+                "url": "http://example.com",
+                "_id": "id1",
+                "ts": 1461095248,
+            },
+            {
+                "type": "blacklist",
+                "action": "add",
+                "reject": {"email": "recipient@example.com", "reason": "manual edit"},
+            },
+        ]
+        response = self.client.post(**mandrill_args(events=raw_events))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.tracking_handler.call_count, 4)
+        events = [kwargs["event"] for _, kwargs in self.tracking_handler.call_args_list]
+        self.assertEqual(
+            [event.event_type for event in events],
+            ["sent", "bounced", "clicked", "unknown"],
+        )
+        self.assertEqual([event.esp_event for event in events], raw_events)
+
     def test_old_tracking_url(self):
         # Earlier versions of Anymail used /mandrill/tracking/ (and didn't support
         # inbound); make sure that URL continues to work.
@@ -39,54 +39,47 @@ class InlineImageTests(AnymailTestMixin, SimpleTestCase):
 
 
 class AnymailStatusTests(AnymailTestMixin, SimpleTestCase):
-    def test_single_recipient(self):
-        recipients = {
-            "one@example.com": AnymailRecipientStatus("12345", "sent"),
-        }
-        status = AnymailStatus()
-        status.set_recipient_status(recipients)
-        self.assertEqual(status.status, {"sent"})
-        self.assertEqual(status.message_id, "12345")
-        self.assertEqual(status.recipients, recipients)
-        self.assertEqual(
-            repr(status),
-            "AnymailStatus<status={'sent'}, message_id='12345', 1 recipients>",
-        )
-        self.assertEqual(
-            repr(status.recipients["one@example.com"]),
-            "AnymailRecipientStatus('12345', 'sent')",
-        )
-
-    def test_multiple_recipients(self):
-        recipients = {
-            "one@example.com": AnymailRecipientStatus("12345", "sent"),
-            "two@example.com": AnymailRecipientStatus("45678", "queued"),
-        }
-        status = AnymailStatus()
-        status.set_recipient_status(recipients)
-        self.assertEqual(status.status, {"queued", "sent"})
-        self.assertEqual(status.message_id, {"12345", "45678"})
-        self.assertEqual(status.recipients, recipients)
-        self.assertEqual(
-            repr(status),
-            "AnymailStatus<status={'queued', 'sent'},"
-            " message_id={'12345', '45678'}, 2 recipients>",
-        )
+    def test_set_recipient_status(self):
+        one = AnymailRecipientStatus("12345", "sent")
+        two = AnymailRecipientStatus("45678", "queued")
+        two_same_id = AnymailRecipientStatus("12345", "queued")
+        # (name, recipients, expected status, expected message_id, expected repr):
+        cases = [
+            (
+                "single recipient",
+                {"one@example.com": one},
+                {"sent"},
+                "12345",
+                "AnymailStatus<status={'sent'}, message_id='12345', 1 recipients>",
+            ),
+            (
+                "multiple recipients",
+                {"one@example.com": one, "two@example.com": two},
+                {"queued", "sent"},
+                {"12345", "45678"},
+                "AnymailStatus<status={'queued', 'sent'},"
+                " message_id={'12345', '45678'}, 2 recipients>",
+            ),
+            (
+                # status.message_id collapses when it's the same for all recipients
+                "multiple recipients same message_id",
+                {"one@example.com": one, "two@example.com": two_same_id},
+                {"queued", "sent"},
+                "12345",
+                "AnymailStatus<status={'queued', 'sent'},"
+                " message_id='12345', 2 recipients>",
+            ),
+        ]
+        for name, recipients, statuses, message_id, expected_repr in cases:
+            with self.subTest(name):
+                status = AnymailStatus()
+                status.set_recipient_status(recipients)
+                self.assertEqual(status.status, statuses)
+                self.assertEqual(status.message_id, message_id)
+                self.assertEqual(status.recipients, recipients)
+                self.assertEqual(repr(status), expected_repr)
 
-    def test_multiple_recipients_same_message_id(self):
-        # status.message_id collapses when it's the same for all recipients
-        recipients = {
-            "one@example.com": AnymailRecipientStatus("12345", "sent"),
-            "two@example.com": AnymailRecipientStatus("12345", "queued"),
-        }
-        status = AnymailStatus()
-        status.set_recipient_status(recipients)
-        self.assertEqual(status.message_id, "12345")
-        self.assertEqual(
-            repr(status),
-            "AnymailStatus<status={'queued', 'sent'},"
-            " message_id='12345', 2 recipients>",
-        )
+        self.assertEqual(repr(one), "AnymailRecipientStatus('12345', 'sent')")
 
     def test_none(self):
         status = AnymailStatus()
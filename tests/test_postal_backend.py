@@ -21,11 +21,44 @@ from .mock_requests_backend import (
 from .utils import (
     SAMPLE_IMAGE_FILENAME,
     AnymailTestMixin,
-    decode_att,
     sample_image_content,
     sample_image_path,
 )
 
+# Successful sends to a single to1@example.com or cc@example.com recipient
+SEND_RESPONSE_TO1 = b"""{
+  "status": "success",
+  "time": 1.08,
+  "flags": {},
+  "data": {
+    "message_id": "9dfcc4df-09a6-4f1d-b535-0eb0a9f104a4@postal.example.com",
+    "messages": {
+      "to1@example.com": { "id": 1531, "token": "xLcafDRCVUFe" }
+    }
+  }
+}"""
+SEND_RESPONSE_CC = b"""{
+  "status": "success",
+  "time": 1.08,
+  "flags": {},
+  "data": {
+    "message_id": "9dfcc4df-09a6-4f1d-b535-0eb0a9f104a4@postal.example.com",
+    "messages": {
+      "cc@example.com": { "id": 1531, "token": "xLcafDRCVUFe" }
+    }
+  }
+}"""
+
+# Postal reports API errors in a (200 status) JSON body
+ERROR_RESPONSE_VALIDATION = b"""{
+    "status": "error",
+    "time": 0.0,
+    "flags": {},
+    "data": {
+        "code": "ValidationError"
+    }
+}"""
+
 
 @tag("postal")
 @override_settings(
@@ -130,7 +163,7 @@ class PostalBackendStandardEmailTests(PostalBackendMockAPITestCase):
         )
         self.assertEqual(data["cc"], ["cc1@example.com", "Also CC <cc2@example.com>"])
         self.assertEqual(data["reply_to"], "another@example.com")
-        self.assertCountEqual(
+        self.assertEqual(
             data["headers"],
             {"Message-ID": "mycustommsgid@sales.example.com", "X-MyHeader": "my value"},
         )
@@ -164,7 +197,7 @@ class PostalBackendStandardEmailTests(PostalBackendMockAPITestCase):
         self.message.extra_headers = {"X-Custom": "string", "X-Num": 123}
         self.message.send()
         data = self.get_api_call_json()
-        self.assertCountEqual(data["headers"], {"X-Custom": "string", "X-Num": 123})
+        self.assertEqual(data["headers"], {"X-Custom": "string", "X-Num": 123})
 
     def test_extra_headers_serialization_error(self):
         self.message.extra_headers = {"X-Custom": Decimal(12.5)}
@@ -215,23 +248,27 @@ class PostalBackendStandardEmailTests(PostalBackendMockAPITestCase):
 
         self.message.send()
         data = self.get_api_call_json()
-        attachments = data["attachments"]
-        self.assertEqual(len(attachments), 3)
-        self.assertEqual(attachments[0]["name"], "test.txt")
-        self.assertEqual(attachments[0]["content_type"], "text/plain")
         self.assertEqual(
-            decode_att(attachments[0]["data"]).decode("ascii"), text_content
+            data["attachments"],
+            [
+                {
+                    "name": "test.txt",
+                    "content_type": "text/plain",
+                    "data": b64encode(text_content.encode("ascii")).decode("ascii"),
+                },
+                {
+                    "name": "test.png",
+                    "content_type": "image/png",  # inferred from filename
+                    "data": b64encode(png_content).decode("ascii"),
+                },
+                {
+                    "name": "",  # none
+                    "content_type": "application/pdf",
+                    "data": b64encode(pdf_content).decode("ascii"),
+                },
+            ],
         )
 
-        # content_type inferred from filename:
-        self.assertEqual(attachments[1]["content_type"], "image/png")
-        self.assertEqual(attachments[1]["name"], "test.png")
-        self.assertEqual(decode_att(attachments[1]["data"]), png_content)
-
-        self.assertEqual(attachments[2]["content_type"], "application/pdf")
-        self.assertEqual(attachments[2]["name"], "")  # none
-        self.assertEqual(decode_att(attachments[2]["data"]), pdf_content)
-
     def test_unicode_attachment_correctly_decoded(self):
         self.message.attach(
             "Une pièce jointe.html", "<p>\u2019</p>", mimetype="text/html"
@@ -330,20 +367,12 @@ class PostalBackendStandardEmailTests(PostalBackendMockAPITestCase):
         self.assertNotIn("To", data)
 
     def test_api_failure(self):
-        failure_response = b"""{
-            "status": "error",
-            "time": 0.0,
-            "flags": {},
-            "data": {
-                "code": "ValidationError"
-            }
-        }"""
-        self.set_mock_response(status_code=200, raw=failure_response)
+        self.set_mock_response(status_code=200, raw=ERROR_RESPONSE_VALIDATION)
         with self.assertRaisesMessage(AnymailAPIError, "Postal API response 200"):
             mail.send_mail("Subject", "Body", "from@example.com", ["to@example.com"])
 
         # Make sure fail_silently is respected
-        self.set_mock_response(status_code=200, raw=failure_response)
+        self.set_mock_response(status_code=200, raw=ERROR_RESPONSE_VALIDATION)
         sent = mail.send_mail(
             "Subject",
             "Body",
@@ -355,28 +384,20 @@ class PostalBackendStandardEmailTests(PostalBackendMockAPITestCase):
 
     def test_api_error_includes_details(self):
         """AnymailAPIError should include ESP's error message"""
-        # JSON error response:
-        error_response = b"""{
-            "status": "error",
-            "time": 0.0,
-            "flags": {},
-            "data": {
-                "code": "ValidationError"
-            }
-        }"""
-        self.set_mock_response(status_code=200, raw=error_response)
-        with self.assertRaisesMessage(AnymailAPIError, "ValidationError"):
-            self.message.send()
-
-        # Non-JSON error response:
-        self.set_mock_response(status_code=500, raw=b"Ack! Bad proxy!")
-        with self.assertRaisesMessage(AnymailAPIError, "Ack! Bad proxy!"):
-            self.message.send()
-
-        # No content in the error response:
-        self.set_mock_response(status_code=502, raw=None)
-        with self.assertRaises(AnymailAPIError):
-            self.message.send()
+        cases = [
+            ("JSON error response", 200, ERROR_RESPONSE_VALIDATION, "ValidationError"),
+            ("Non-JSON error response", 500, b"Ack! Bad proxy!", "Ack! Bad proxy!"),
+            ("No content in the error response", 502, None, None),
+        ]
+        for description, status_code, raw, expected_message in cases:
+            with self.subTest(description):
+                self.set_mock_response(status_code=status_code, raw=raw)
+                if expected_message is None:
+                    with self.assertRaises(AnymailAPIError):
+                        self.message.send()
+                else:
+                    with self.assertRaisesMessage(AnymailAPIError, expected_message):
+                        self.message.send()
 
 
 @tag("postal")
@@ -389,15 +410,23 @@ class PostalBackendAnymailFeatureTests(PostalBackendMockAPITestCase):
         data = self.get_api_call_json()
         self.assertEqual(data["sender"], "anything@bounces.example.com")
 
-    def test_metadata(self):
-        self.message.metadata = {"user_id": "12345", "items": 6}
-        with self.assertRaisesMessage(AnymailUnsupportedFeature, "metadata"):
-            self.message.send()
-
-    def test_send_at(self):
-        self.message.send_at = 1651820889  # 2022-05-06 07:08:09 UTC
-        with self.assertRaisesMessage(AnymailUnsupportedFeature, "send_at"):
-            self.message.send()
+    UNSUPPORTED_FEATURE_CASES = [
+        ("metadata", {"user_id": "12345", "items": 6}),
+        ("send_at", 1651820889),  # 2022-05-06 07:08:09 UTC
+        ("track_opens", True),
+        ("track_clicks", True),
+    ]
+
+    def test_unsupported_features(self):
+        for attr, value in self.UNSUPPORTED_FEATURE_CASES:
+            with self.subTest(feature=attr):
+                message = mail.EmailMultiAlternatives(
+                    "Subject", "Text Body", "from@example.com", ["to@example.com"]
+                )
+                setattr(message, attr, value)
+                with self.assertRaisesMessage(AnymailUnsupportedFeature, attr):
+                    message.send()
+        self.assert_esp_not_called()
 
     def test_tags(self):
         self.message.tags = ["receipt"]
@@ -409,16 +438,6 @@ class PostalBackendAnymailFeatureTests(PostalBackendMockAPITestCase):
         with self.assertRaisesMessage(AnymailUnsupportedFeature, "multiple tags"):
             self.message.send()
 
-    def test_track_opens(self):
-        self.message.track_opens = True
-        with self.assertRaisesMessage(AnymailUnsupportedFeature, "track_opens"):
-            self.message.send()
-
-    def test_track_clicks(self):
-        self.message.track_clicks = True
-        with self.assertRaisesMessage(AnymailUnsupportedFeature, "track_clicks"):
-            self.message.send()
-
     def test_default_omits_options(self):
         """Make sure by default we don't send any ESP-specific options.
 
@@ -441,18 +460,7 @@ class PostalBackendAnymailFeatureTests(PostalBackendMockAPITestCase):
     # noinspection PyUnresolvedReferences
     def test_send_attaches_anymail_status(self):
         """The anymail_status should be attached to the message when it is sent"""
-        response_content = b"""{
-          "status": "success",
-          "time": 1.08,
-          "flags": {},
-          "data": {
-            "message_id": "9dfcc4df-09a6-4f1d-b535-0eb0a9f104a4@postal.example.com",
-            "messages": {
-              "to1@example.com": { "id": 1531, "token": "xLcafDRCVUFe" }
-            }
-          }
-        }"""
-        self.set_mock_response(raw=response_content)
+        self.set_mock_response(raw=SEND_RESPONSE_TO1)
         msg = mail.EmailMessage(
             "Subject",
             "Message",
@@ -469,23 +477,12 @@ class PostalBackendAnymailFeatureTests(PostalBackendMockAPITestCase):
         self.assertEqual(
             msg.anymail_status.recipients["to1@example.com"].message_id, 1531
         )
-        self.assertEqual(msg.anymail_status.esp_response.content, response_content)
+        self.assertEqual(msg.anymail_status.esp_response.content, SEND_RESPONSE_TO1)
 
     # noinspection PyUnresolvedReferences
     def test_send_without_to_attaches_anymail_status(self):
         """The anymail_status should be attached even if there are no `to` recipients"""
-        response_content = b"""{
-          "status": "success",
-          "time": 1.08,
-          "flags": {},
-          "data": {
-            "message_id": "9dfcc4df-09a6-4f1d-b535-0eb0a9f104a4@postal.example.com",
-            "messages": {
-              "cc@example.com": { "id": 1531, "token": "xLcafDRCVUFe" }
-            }
-          }
-        }"""
-        self.set_mock_response(raw=response_content)
+        self.set_mock_response(raw=SEND_RESPONSE_CC)
         msg = mail.EmailMessage(
             "Subject",
             "Message",
@@ -502,7 +499,7 @@ class PostalBackendAnymailFeatureTests(PostalBackendMockAPITestCase):
         self.assertEqual(
             msg.anymail_status.recipients["cc@example.com"].message_id, 1531
         )
-        self.assertEqual(msg.anymail_status.esp_response.content, response_content)
+        self.assertEqual(msg.anymail_status.esp_response.content, SEND_RESPONSE_CC)
 
     # noinspection PyUnresolvedReferences
     def test_send_failed_anymail_status(self):
@@ -2,6 +2,7 @@ import os
 import unittest
 from email.utils import formataddr
 
+from django.core import mail
 from django.test import SimpleTestCase, override_settings, tag
 
 from anymail.exceptions import AnymailAPIError
@@ -36,6 +37,18 @@ class PostalBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
     If these variables are not set, these tests won't run.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Share one open connection across all the tests:
+        cls.connection = mail.get_connection()
+        cls.connection.open()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
         self.from_email = "from@%s" % ANYMAIL_TEST_POSTAL_DOMAIN
@@ -44,6 +57,7 @@ class PostalBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
             "Text content",
             self.from_email,
             ["test+to1@anymail.dev"],
+            connection=self.connection,
         )
         self.message.attach_alternative("<p>HTML content</p>", "text/html")
 
@@ -74,6 +88,7 @@ class PostalBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
             reply_to=["reply1@example.com"],
             headers={"X-Anymail-Test": "value"},
             tags=["tag 1"],  # max one tag
+            connection=self.connection,
         )
         message.attach("attachment1.txt", "Here is some\ntext for you", "text/plain")
         message.attach("attachment2.csv", "ID,Name\n1,Amy Lina", "text/csv")
@@ -108,6 +123,8 @@ class PostalBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
 
     @override_settings(ANYMAIL_POSTAL_API_KEY="Hey, that's not an API key!")
     def test_invalid_server_token(self):
+        # use a new connection, with the overridden (invalid) API key:
+        self.message.connection = None
         with self.assertRaises(AnymailAPIError) as cm:
             self.message.send()
         err = cm.exception
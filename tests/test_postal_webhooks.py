@@ -13,6 +13,9 @@ from anymail.webhooks.postal import PostalTrackingWebhookView
 from .utils_postal import ClientWithPostalSignature, make_key
 from .webhook_cases import WebhookTestCase
 
+# Expected event.timestamp for the delivery events below
+EVENT_TIMESTAMP = datetime.fromtimestamp(1606753101, tz=timezone.utc)
+
 
 @tag("postal")
 @unittest.skipUnless(
@@ -28,29 +31,16 @@ class PostalWebhookSecurityTestCase(WebhookTestCase):
         self.client.set_private_key(make_key())
 
     def test_failed_signature_check(self):
-        response = self.client.post(
-            "/anymail/postal/tracking/",
-            content_type="application/json",
-            data=json.dumps({"some": "data"}),
-            HTTP_X_POSTAL_SIGNATURE=b64encode("invalid".encode("utf-8")),
-        )
-        self.assertEqual(response.status_code, 400)
-
-        response = self.client.post(
-            "/anymail/postal/tracking/",
-            content_type="application/json",
-            data=json.dumps({"some": "data"}),
-            HTTP_X_POSTAL_SIGNATURE="garbage",
-        )
-        self.assertEqual(response.status_code, 400)
-
-        response = self.client.post(
-            "/anymail/postal/tracking/",
-            content_type="application/json",
-            data=json.dumps({"some": "data"}),
-            HTTP_X_POSTAL_SIGNATURE="",
-        )
-        self.assertEqual(response.status_code, 400)
+        body = json.dumps({"some": "data"})
+        for signature in [b64encode("invalid".encode("utf-8")), "garbage", ""]:
+            with self.subTest(signature=signature):
+                response = self.client.post(
+                    "/anymail/postal/tracking/",
+                    content_type="application/json",
+                    data=body,
+                    HTTP_X_POSTAL_SIGNATURE=signature,
+                )
+                self.assertEqual(response.status_code, 400)
 
 
 @tag("postal")
@@ -121,9 +111,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         self.assertIsInstance(event, AnymailTrackingEvent)
         self.assertEqual(event.event_type, "bounced")
         self.assertEqual(event.esp_event, raw_event)
-        self.assertEqual(
-            event.timestamp, datetime.fromtimestamp(1606753101, tz=timezone.utc)
-        )
+        self.assertEqual(event.timestamp, EVENT_TIMESTAMP)
         self.assertEqual(event.message_id, 233843)
         self.assertEqual(event.event_id, "0fcc831f-92b9-4e2b-97f2-d873abc77fab")
         self.assertEqual(event.recipient, "bounce@example.com")
@@ -174,9 +162,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         self.assertIsInstance(event, AnymailTrackingEvent)
         self.assertEqual(event.event_type, "deferred")
         self.assertEqual(event.esp_event, raw_event)
-        self.assertEqual(
-            event.timestamp, datetime.fromtimestamp(1606753101, tz=timezone.utc)
-        )
+        self.assertEqual(event.timestamp, EVENT_TIMESTAMP)
         self.assertEqual(event.message_id, 1564)
         self.assertEqual(event.event_id, "0fcc831f-92b9-4e2b-97f2-d873abc77fab")
         self.assertEqual(event.recipient, "deferred@example.com")
@@ -228,9 +214,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         self.assertIsInstance(event, AnymailTrackingEvent)
         self.assertEqual(event.event_type, "queued")
         self.assertEqual(event.esp_event, raw_event)
-        self.assertEqual(
-            event.timestamp, datetime.fromtimestamp(1606753101, tz=timezone.utc)
-        )
+        self.assertEqual(event.timestamp, EVENT_TIMESTAMP)
         self.assertEqual(event.message_id, 1568)
         self.assertEqual(event.event_id, "9be13015-2e54-456c-bf66-eacbe33da824")
         self.assertEqual(event.recipient, "suppressed@example.com")
@@ -284,9 +268,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         self.assertIsInstance(event, AnymailTrackingEvent)
         self.assertEqual(event.event_type, "failed")
         self.assertEqual(event.esp_event, raw_event)
-        self.assertEqual(
-            event.timestamp, datetime.fromtimestamp(1606753101, tz=timezone.utc)
-        )
+        self.assertEqual(event.timestamp, EVENT_TIMESTAMP)
         self.assertEqual(event.message_id, 1571)
         self.assertEqual(event.event_id, "5fec5077-dae7-4989-94d5-e1963f3e9181")
         self.assertEqual(event.recipient, "failed@example.com")
@@ -337,9 +319,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         self.assertIsInstance(event, AnymailTrackingEvent)
         self.assertEqual(event.event_type, "delivered")
         self.assertEqual(event.esp_event, raw_event)
-        self.assertEqual(
-            event.timestamp, datetime.fromtimestamp(1606753101, tz=timezone.utc)
-        )
+        self.assertEqual(event.timestamp, EVENT_TIMESTAMP)
         self.assertEqual(event.message_id, 1563)
         self.assertEqual(event.recipient, "recipient@example.com")
         self.assertEqual(event.tags, ["welcome-email"])
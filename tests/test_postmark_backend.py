@@ -118,11 +118,11 @@ class PostmarkBackendStandardEmailTests(PostmarkBackendMockAPITestCase):
         self.assertEqual(data["Bcc"], "bcc1@example.com, Also BCC <bcc2@example.com>")
         self.assertEqual(data["Cc"], "cc1@example.com, Also CC <cc2@example.com>")
         self.assertEqual(data["ReplyTo"], "another@example.com")
-        self.assertCountEqual(
+        self.assertEqual(
             data["Headers"],
             [
-                {"Name": "Message-ID", "Value": "mycustommsgid@sales.example.com"},
                 {"Name": "X-MyHeader", "Value": "my value"},
+                {"Name": "Message-ID", "Value": "mycustommsgid@sales.example.com"},
             ],
         )
 
@@ -155,7 +155,7 @@ class PostmarkBackendStandardEmailTests(PostmarkBackendMockAPITestCase):
         self.message.extra_headers = {"X-Custom": "string", "X-Num": 123}
         self.message.send()
         data = self.get_api_call_json()
-        self.assertCountEqual(
+        self.assertEqual(
             data["Headers"],
             [{"Name": "X-Custom", "Value": "string"}, {"Name": "X-Num", "Value": 123}],
         )
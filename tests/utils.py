@@ -3,8 +3,9 @@ import re
 import sys
 import uuid
 import warnings
-from base64 import b64decode
+from binascii import a2b_base64
 from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO, StringIO
 from pathlib import Path
 from unittest import TestCase
@@ -15,7 +16,8 @@ import django.test.client
 
 def decode_att(att):
     """Returns the original data from base64-encoded attachment content"""
-    return b64decode(att.encode("ascii"))
+    # (a2b_base64 accepts str or bytes, without b64decode's extra wrapping)
+    return a2b_base64(att)
 
 
 def rfc822_unfold(text):
@@ -35,13 +37,18 @@ SAMPLE_IMAGE_FILENAME = "sample_image.png"
 SAMPLE_EMAIL_FILENAME = "sample_email.txt"
 
 
+@lru_cache(maxsize=None)
 def test_file_path(filename):
     """Returns path to a test file"""
     return TEST_FILES_DIR.joinpath(filename)
 
 
+@lru_cache(maxsize=None)
 def test_file_content(filename):
-    """Returns contents (bytes) of a test file"""
+    """Returns contents (bytes) of a test file
+
+    (Cached: each file is read from disk only once per test run.)
+    """
     return TEST_FILES_DIR.joinpath(filename).read_bytes()
 
 
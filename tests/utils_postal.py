@@ -1,4 +1,5 @@
 from base64 import b64encode
+from functools import lru_cache
 
 from django.test import override_settings
 
@@ -12,15 +13,20 @@ except ImportError:
     HAS_CRYPTOGRAPHY = False
 
 
+@lru_cache(maxsize=None)
 def make_key():
-    """Generate RSA public key with short key size, for testing only"""
+    """Generate a 1024-bit RSA private key, for testing only
+
+    (Cached: generating the key is slow, and any key will do for the tests.)
+    """
     private_key = rsa.generate_private_key(
         public_exponent=65537,
-        key_size=512,
+        key_size=1024,  # smallest size current cryptography versions allow
     )
     return private_key
 
 
+@lru_cache(maxsize=None)
 def derive_public_webhook_key(private_key):
     """Derive public"""
     public_key = private_key.public_key()